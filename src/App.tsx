@@ -11,7 +11,7 @@ const statisticalExamples: CodeExample[] = [
     name: "Simple Correlation & Regression",
     file: "simple_correlation_regression.py",
     description:
-      "Basic correlation analysis and simple linear regression using NumPy and statsmodels",
+      "Basic correlation analysis and simple linear regression using NumPy and a QR least-squares solver",
   },
   {
     name: "Scatter Plot with Regression",
@@ -29,7 +29,13 @@ const CodeEditor: React.FC<CodeEditorProps> = ({
   examples = [],
   onExampleSelect,
 }) => {
-  const { loading, runPython, runJavaScript, installPackage } = usePyodide();
+  const {
+    loading,
+    error: pyodideError,
+    runPython,
+    runJavaScript,
+    installPackage,
+  } = usePyodide();
   const [language, setLanguage] = useState<"python" | "javascript">(
     defaultLanguage
   );
@@ -281,6 +287,12 @@ const CodeEditor: React.FC<CodeEditorProps> = ({
         </button>
       </div>
 
+      {pyodideError && language === "python" && (
+        <div className="p-2 bg-red-100 text-red-700 text-sm text-left border-b border-red-300">
+          {pyodideError.message}
+        </div>
+      )}
+
       {isDiffMode ? (
         <div className="flex flex-col">
           <div className="p-2 bg-gray-700 text-white text-sm">
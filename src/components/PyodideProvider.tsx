@@ -11,6 +11,8 @@ import type { PyodideInterface } from "pyodide";
 // Move constants to a separate file
 // List of common packages to preload
 const COMMON_PACKAGES = ["numpy", "pandas"];
+// Helper modules imported by the statistical examples
+const EXAMPLE_MODULES = ["_data.py"];
 
 interface PyodideContextType {
   pyodide: PyodideInterface | null;
@@ -88,6 +90,32 @@ export const PyodideProvider = ({ children }: PyodideProviderProps) => {
           // Continue even if package loading fails
         }
 
+        // Copy the example helper modules into the Pyodide home directory
+        // (on sys.path) so the examples can import them. Modules stay
+        // imported between runs, so their caches are shared across examples.
+        for (const moduleFile of EXAMPLE_MODULES) {
+          try {
+            let response = await fetch(`/src/examples/${moduleFile}`);
+            if (!response.ok) {
+              response = await fetch(`/examples/${moduleFile}`);
+            }
+            if (!response.ok) {
+              throw new Error(response.statusText);
+            }
+            pyodideInstance.FS.writeFile(moduleFile, await response.text());
+          } catch (moduleErr) {
+            console.error(
+              `Failed to load example module ${moduleFile}:`,
+              moduleErr
+            );
+            setError(
+              new Error(
+                `Failed to load example module ${moduleFile}: ${moduleErr}`
+              )
+            );
+          }
+        }
+
         setLoading(false);
       } catch (err) {
         console.error("Error loading Pyodide:", err);
@@ -181,6 +209,14 @@ export const PyodideProvider = ({ children }: PyodideProviderProps) => {
           if (moduleMatch && moduleMatch[1]) {
             const moduleName = moduleMatch[1];
 
+            // Example helper modules are local files, not installable packages
+            if (EXAMPLE_MODULES.includes(`${moduleName}.py`)) {
+              throw new Error(
+                `Example helper module ${moduleName}.py could not be loaded into the Python environment. ` +
+                  "Check the browser console for the error and reload the page."
+              );
+            }
+
             // Try to install the missing package
             try {
               stdoutContent += `\nAttempting to install missing package: ${moduleName}...\n`;
@@ -0,0 +1,33 @@
+"""
+Shared synthetic data and helpers for the correlation and regression examples.
+
+The examples draw the same correlated x/y sample, so the generator is
+memoized: when several examples run in the same Python session (as they do
+in the Pyodide app, where this module stays imported between runs), the data
+are generated only once for each set of arguments.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def make_xy(n=100, seed=42, slope=0.7, noise=0.7):
+    """Return x ~ N(0, 1) and y = slope * x + N(0, noise^2), each of length n.
+
+    The arrays are shared between callers, so they are returned read-only.
+    """
+    rng = np.random.default_rng(seed)
+    x = rng.standard_normal(n)
+    y = slope * x + rng.standard_normal(n) * noise
+    x.flags.writeable = False
+    y.flags.writeable = False
+    return x, y
+
+
+def pearson(x, y):
+    """Pearson correlation of two 1-D arrays, computed from three dot products."""
+    xm = x - x.mean()
+    ym = y - y.mean()
+    return (xm @ ym) / np.sqrt((xm @ xm) * (ym @ ym))
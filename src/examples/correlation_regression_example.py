@@ -4,100 +4,118 @@ Correlation and Regression Analysis Example
 This script demonstrates:
 1. Generating random data with a known correlation
 2. Calculating correlation using NumPy
-3. Performing linear regression using statsmodels
+3. Performing linear regression with a QR-based least-squares solver
 4. Visualizing the results
 """
 
 import numpy as np
-import statsmodels.api as sm
+import scipy.linalg
+from scipy import stats
 import matplotlib.pyplot as plt
-from statsmodels.graphics.regressionplots import abline_plot
 
-# Set a random seed for reproducibility
-np.random.seed(42)
+from _data import make_xy, pearson
+
 
-# Generate sample data with a known correlation
+# Generate sample data with a known correlation (seeded for reproducibility):
+# x from a standard normal distribution and y with a moderate positive
+# correlation with x (correlation ≈ 0.7)
 n = 100  # number of observations
-x = np.random.normal(0, 1, n)  # independent variable from standard normal distribution
-# Create y with a moderate positive correlation with x (correlation ≈ 0.7)
-y = 0.7 * x + np.random.normal(0, 0.7, n)  # dependent variable
+x, y = make_xy(n)
 
 # Calculate correlation using NumPy
-correlation = np.corrcoef(x, y)[0, 1]
+correlation = pearson(x, y)
 print(f"Correlation coefficient: {correlation:.4f}")
 
-# Perform simple linear regression using statsmodels
-# Add a constant (intercept) to the independent variable
-X = sm.add_constant(x)
-
-# Create a linear regression model and fit it to the data
-model = sm.OLS(y, X).fit()
-
-# Print regression summary
+# Perform simple linear regression
+# Add a constant (intercept) column to the independent variable
+X = np.column_stack([np.ones_like(x), x])
+
+# Solve the least-squares problem through the QR decomposition X = QR:
+# R @ beta = Q.T @ y is solved by back-substitution
+Q, R = np.linalg.qr(X)
+beta = scipy.linalg.solve_triangular(R, Q.T @ y)
+fitted_values = X @ beta
+residuals = y - fitted_values
+df_resid = n - 2
+
+# Coefficient covariance sigma^2 * (X'X)^-1, where (X'X)^-1 = R^-1 @ R^-T
+sigma2 = residuals @ residuals / df_resid
+cov = sigma2 * scipy.linalg.solve_triangular(R, scipy.linalg.solve_triangular(R.T, np.eye(2), lower=True))
+bse = np.sqrt(np.diag(cov))
+tvals = beta / bse
+pvals = 2 * stats.t.sf(np.abs(tvals), df_resid)
+r_squared = 1 - (residuals @ residuals) / np.sum((y - y.mean()) ** 2)
+intercept, slope = beta
+slope_p_value = pvals[1]
+
+# 95% confidence intervals for the coefficients
+t_crit = stats.t.ppf(0.975, df_resid)
+conf_lower = beta - t_crit * bse
+conf_upper = beta + t_crit * bse
+
+# Print regression summary (coefficient table)
 print("\nRegression Summary:")
-print(model.summary().tables[1])  # Print only the coefficient table
+print(f"{'Parameter':<10} {'Coefficient':<12} {'Std Error':<12} {'t-value':<10} {'p-value':<10} {'[0.025':<10} {'0.975]':<10}")
+print("-" * 82)
+print("\n".join(
+    f"{name:<10} {coef:<12.4f} {se:<12.4f} {t:<10.4f} {p:<10.4e} {lower:<10.4f} {upper:<10.4f}"
+    for name, coef, se, t, p, lower, upper in zip(['const', 'x'], beta, bse, tvals, pvals, conf_lower, conf_upper)
+))
 
 # Calculate predictions for plotting
-x_pred = np.linspace(min(x), max(x), 100)
-X_pred = sm.add_constant(x_pred)
-y_pred = model.predict(X_pred)
+x_pred = np.linspace(x.min(), x.max(), 100)
+y_pred = intercept + slope * x_pred
+
+# Create a single figure holding both plots: the scatter plot with the
+# regression line on the left and the residual plot on the right
+fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 6))
 
 # Create a scatter plot with regression line
-plt.figure(figsize=(10, 6))
-plt.scatter(x, y, alpha=0.6, label='Data Points')
-plt.plot(x_pred, y_pred, 'r-', label=f'Regression Line: y = {model.params[1]:.4f}x + {model.params[0]:.4f}')
-plt.title(f'Correlation: {correlation:.4f}, R-squared: {model.rsquared:.4f}')
-plt.xlabel('X Variable')
-plt.ylabel('Y Variable')
-plt.legend()
-plt.grid(True, alpha=0.3)
+ax1.scatter(x, y, alpha=0.6, label='Data Points')
+ax1.plot(x_pred, y_pred, 'r-', label=f'Regression Line: y = {slope:.4f}x + {intercept:.4f}')
+ax1.set_title(f'Correlation: {correlation:.4f}, R-squared: {r_squared:.4f}')
+ax1.set_xlabel('X Variable')
+ax1.set_ylabel('Y Variable')
+ax1.legend()
+ax1.grid(True, alpha=0.3)
 
 # Add text with regression statistics
 stats_text = (
     f"Regression Statistics:\n"
-    f"Slope: {model.params[1]:.4f}\n"
-    f"Intercept: {model.params[0]:.4f}\n"
-    f"R-squared: {model.rsquared:.4f}\n"
-    f"p-value: {model.pvalues[1]:.4e}"
+    f"Slope: {slope:.4f}\n"
+    f"Intercept: {intercept:.4f}\n"
+    f"R-squared: {r_squared:.4f}\n"
+    f"p-value: {slope_p_value:.4e}"
 )
-plt.annotate(stats_text, xy=(0.05, 0.95), xycoords='axes fraction', 
+ax1.annotate(stats_text, xy=(0.05, 0.95), xycoords='axes fraction',
              bbox=dict(boxstyle="round,pad=0.5", fc="white", alpha=0.8),
              va='top', fontsize=10)
 
-# Show the plot (this would display in a Jupyter notebook or when run locally)
-# In Pyodide, we'll need to convert this to a format that can be displayed in the browser
-
 # Interpretation of results
 print("\nInterpretation:")
 print(f"1. The correlation coefficient of {correlation:.4f} indicates a strong positive relationship between X and Y.")
-print(f"2. The regression model explains {model.rsquared:.1%} of the variance in Y (R-squared).")
-print(f"3. For each unit increase in X, Y increases by {model.params[1]:.4f} units on average.")
-print(f"4. The p-value of {model.pvalues[1]:.4e} indicates that this relationship is statistically significant.")
+print(f"2. The regression model explains {r_squared:.1%} of the variance in Y (R-squared).")
+print(f"3. For each unit increase in X, Y increases by {slope:.4f} units on average.")
+print(f"4. The p-value of {slope_p_value:.4e} indicates that this relationship is statistically significant.")
 
 # Additional analysis: Residuals
-residuals = model.resid
 print("\nResidual Analysis:")
 print(f"Mean of residuals: {np.mean(residuals):.4e}")  # Should be close to zero
 print(f"Standard deviation of residuals: {np.std(residuals):.4f}")
 
 # Example of how to test for normality of residuals
-from scipy import stats
-_, normality_p_value = stats.normaltest(residuals)
-print(f"Normality test p-value: {normality_p_value:.4f}")
+_, normality_p_value = stats.jarque_bera(residuals)
+print(f"Normality test (Jarque-Bera) p-value: {normality_p_value:.4f}")
 print("Interpretation: If p-value > 0.05, residuals are approximately normally distributed.")
 
 # Example of how to check for heteroscedasticity
 # Plot residuals vs. fitted values
-plt.figure(figsize=(10, 6))
-plt.scatter(model.fittedvalues, residuals, alpha=0.6)
-plt.axhline(y=0, color='r', linestyle='-')
-plt.title('Residuals vs Fitted Values')
-plt.xlabel('Fitted Values')
-plt.ylabel('Residuals')
-plt.grid(True, alpha=0.3)
-
-# Add a horizontal line at y=0 for reference
-plt.axhline(y=0, color='r', linestyle='-')
+ax2.scatter(fitted_values, residuals, alpha=0.6)
+ax2.axhline(y=0, color='r', linestyle='-')  # Horizontal reference line at y=0
+ax2.set_title('Residuals vs Fitted Values')
+ax2.set_xlabel('Fitted Values')
+ax2.set_ylabel('Residuals')
+ax2.grid(True, alpha=0.3)
 
 # Show the plot (this would display in a Jupyter notebook or when run locally)
 # In Pyodide, we'll need to convert this to a format that can be displayed in the browser 
\ No newline at end of file
@@ -4,28 +4,27 @@ Multiple Regression Analysis Example
 This script demonstrates:
 1. Generating random data with multiple predictors
 2. Calculating correlation matrix
-3. Performing multiple regression using statsmodels
+3. Performing multiple regression with a Cholesky solve of the normal equations
 4. Interpreting regression results
 """
 
 import numpy as np
-import statsmodels.api as sm
+import scipy.linalg
+from scipy import stats
 import pandas as pd
 
-# Set a random seed for reproducibility
-np.random.seed(42)
+# Create a seeded random number generator for reproducibility
+rng = np.random.default_rng(42)
 
 # Generate sample data with multiple predictors
 n = 100  # number of observations
 
-# Generate three independent variables
-x1 = np.random.normal(0, 1, n)  # predictor 1
-x2 = np.random.normal(0, 1, n)  # predictor 2
-x3 = np.random.normal(0, 1, n)  # predictor 3
+# Generate three independent variables in a single draw
+x1, x2, x3 = rng.standard_normal((n, 3)).T  # predictors 1, 2 and 3
 
 # Create dependent variable with known relationships
 # y has strong relationship with x1, moderate with x2, and weak with x3
-y = 0.8 * x1 + 0.4 * x2 + 0.1 * x3 + np.random.normal(0, 1, n)
+y = 0.8 * x1 + 0.4 * x2 + 0.1 * x3 + rng.standard_normal(n)
 
 # Create a DataFrame for easier data manipulation
 data = pd.DataFrame({
@@ -42,33 +41,59 @@ print(corr_matrix)
 print("\n")
 
 # Perform multiple regression
-X = sm.add_constant(data[['x1', 'x2', 'x3']])  # Add constant term
-model = sm.OLS(data['y'], X).fit()
+names = ['const', 'x1', 'x2', 'x3']
+Xm = np.column_stack([np.ones(n), data[['x1', 'x2', 'x3']].to_numpy()])  # Add constant term
+k = Xm.shape[1]  # number of parameters, including the constant
+df_resid = n - k
+
+# Solve the normal equations (X'X) beta = X'y; X'X is symmetric positive
+# definite, so it is factored once with Cholesky and the factor is reused
+# for both the solve and the coefficient covariance (X'X)^-1
+XtX = Xm.T @ Xm
+Xty = Xm.T @ data['y'].values
+c = scipy.linalg.cho_factor(XtX, check_finite=False)
+beta = scipy.linalg.cho_solve(c, Xty, check_finite=False)
+XtX_inv = scipy.linalg.cho_solve(c, np.eye(k), check_finite=False)
+
+residuals = data['y'].values - Xm @ beta
+sigma2 = residuals @ residuals / df_resid
+cov = sigma2 * XtX_inv
+bse = np.sqrt(np.diag(cov))
+tvals = beta / bse
+pvals = 2 * stats.t.sf(np.abs(tvals), df_resid)
+
+# Goodness of fit
+r_squared = 1 - (residuals @ residuals) / np.sum((y - y.mean()) ** 2)
+r_squared_adj = 1 - (1 - r_squared) * (n - 1) / df_resid
+f_value = (r_squared / (k - 1)) / ((1 - r_squared) / df_resid)
+f_pvalue = stats.f.sf(f_value, k - 1, df_resid)
 
 # Print regression summary
 print("Multiple Regression Results:")
-print(f"R-squared: {model.rsquared:.4f}")
-print(f"Adjusted R-squared: {model.rsquared_adj:.4f}")
-print(f"F-statistic: {model.fvalue:.4f}")
-print(f"Prob (F-statistic): {model.f_pvalue:.4e}")
+print(f"R-squared: {r_squared:.4f}")
+print(f"Adjusted R-squared: {r_squared_adj:.4f}")
+print(f"F-statistic: {f_value:.4f}")
+print(f"Prob (F-statistic): {f_pvalue:.4e}")
 
 # Print coefficient statistics
 print("\nCoefficient Statistics:")
 print(f"{'Parameter':<10} {'Coefficient':<12} {'Std Error':<12} {'t-value':<10} {'p-value':<10}")
 print("-" * 60)
-for i, name in enumerate(['const', 'x1', 'x2', 'x3']):
-    print(f"{name:<10} {model.params[i]:<12.4f} {model.bse[i]:<12.4f} {model.tvalues[i]:<10.4f} {model.pvalues[i]:<10.4e}")
+print("\n".join(
+    f"{name:<10} {coef:<12.4f} {se:<12.4f} {t:<10.4f} {p:<10.4e}"
+    for name, coef, se, t, p in zip(names, beta, bse, tvals, pvals)
+))
 
 # Interpretation of results
 print("\nInterpretation:")
-print(f"1. The model explains {model.rsquared:.1%} of the variance in Y (R-squared).")
+print(f"1. The model explains {r_squared:.1%} of the variance in Y (R-squared).")
 print("2. Coefficient interpretation:")
 
 # Loop through predictors to provide interpretation
 predictors = ['x1', 'x2', 'x3']
 for i, pred in enumerate(predictors):
-    coef = model.params[i+1]  # +1 to skip the constant
-    p_val = model.pvalues[i+1]
+    coef = beta[i+1]  # +1 to skip the constant
+    p_val = pvals[i+1]
     
     # Determine significance
     if p_val < 0.001:
@@ -86,19 +111,21 @@ for i, pred in enumerate(predictors):
     print(f"     holding other variables constant. This effect is {sig_level} (p={p_val:.4e}).")
 
 # Variance Inflation Factor (VIF) for multicollinearity check
-from statsmodels.stats.outliers_influence import variance_inflation_factor
+# The VIFs of the predictors are the diagonal of the inverse of their
+# correlation matrix, so a single 3x3 inverse of the correlation matrix
+# computed above gives all of them at once. The VIF is not defined for the
+# constant term.
+predictor_corr = corr_matrix.loc[['x1', 'x2', 'x3'], ['x1', 'x2', 'x3']].values
 
-# Calculate VIF for each predictor
 vif_data = pd.DataFrame()
-vif_data["Variable"] = X.columns
-vif_data["VIF"] = [variance_inflation_factor(X.values, i) for i in range(X.shape[1])]
+vif_data["Variable"] = names
+vif_data["VIF"] = [np.nan] + list(np.diag(np.linalg.inv(predictor_corr)))
 
 print("\nVariance Inflation Factors (VIF):")
 print(vif_data)
 print("Note: VIF > 5 suggests potential multicollinearity issues.")
 
 # Residual analysis
-residuals = model.resid
 print("\nResidual Analysis:")
 print(f"Mean of residuals: {np.mean(residuals):.4e}")  # Should be close to zero
 print(f"Standard deviation of residuals: {np.std(residuals):.4f}")
@@ -111,19 +138,20 @@ new_data = pd.DataFrame({
 })
 
 # Add constant term
-new_X = sm.add_constant(new_data)
+new_X = np.column_stack([np.ones(len(new_data)), new_data.to_numpy()])
 
-# Make predictions
-predictions = model.predict(new_X)
+# Predictions and their 95% confidence intervals from the same design matrix;
+# the standard error of the mean prediction is sqrt(x0' @ cov @ x0) per row x0
+predictions = new_X @ beta
+pred_se = np.sqrt(np.sum((new_X @ cov) * new_X, axis=1))
+t_crit = stats.t.ppf(0.975, df_resid)
+pred_conf = np.stack([predictions - t_crit * pred_se, predictions + t_crit * pred_se], axis=1)
 
 print("\nPredictions for new data points:")
-for i in range(len(new_data)):
-    print(f"Data point {i+1}:")
-    print(f"  x1 = {new_data['x1'].iloc[i]:.2f}, x2 = {new_data['x2'].iloc[i]:.2f}, x3 = {new_data['x3'].iloc[i]:.2f}")
-    print(f"  Predicted y = {predictions[i]:.4f}")
+for i, ((x1_val, x2_val, x3_val), pred) in enumerate(zip(new_data.to_numpy(), predictions), start=1):
+    print(f"Data point {i}:")
+    print(f"  x1 = {x1_val:.2f}, x2 = {x2_val:.2f}, x3 = {x3_val:.2f}")
+    print(f"  Predicted y = {pred:.4f}")
 
-# Confidence intervals for the predictions
-pred_conf = model.get_prediction(new_X).conf_int(alpha=0.05)
 print("\nPrediction 95% Confidence Intervals:")
-for i in range(len(new_data)):
-    print(f"Data point {i+1}: [{pred_conf[i,0]:.4f}, {pred_conf[i,1]:.4f}]") 
\ No newline at end of file
+print("\n".join(f"Data point {i}: [{lower:.4f}, {upper:.4f}]" for i, (lower, upper) in enumerate(pred_conf, start=1))) 
\ No newline at end of file
@@ -15,51 +15,56 @@ import numpy as np
 import statsmodels.api as sm
 import matplotlib.pyplot as plt
 
-# Set a random seed for reproducibility
-np.random.seed(42)
+from _data import make_xy, pearson
 
-# Generate sample data with a known correlation
+
+# Generate sample data with a known correlation (seeded for reproducibility):
+# x from a standard normal distribution and y with a moderate positive
+# correlation with x (correlation ≈ 0.7)
 n = 50  # number of observations
-x = np.random.normal(0, 1, n)  # independent variable from standard normal distribution
-# Create y with a moderate positive correlation with x (correlation ≈ 0.7)
-y = 0.7 * x + np.random.normal(0, 0.7, n)  # dependent variable
+x, y = make_xy(n)
 
 # Calculate correlation using NumPy
-correlation = np.corrcoef(x, y)[0, 1]
+correlation = pearson(x, y)
 print(f"Correlation coefficient: {correlation:.4f}")
 
 # Perform simple linear regression using statsmodels
 X = sm.add_constant(x)  # Add a constant (intercept) to the independent variable
 model = sm.OLS(y, X).fit()  # Create and fit the model
 
+# Extract the statistics used below once from the fitted model
+intercept, slope = model.params
+r_squared = model.rsquared
+slope_p_value = model.pvalues[1]
+
 # Print key regression results
-print(f"Intercept: {model.params[0]:.4f}")
-print(f"Slope: {model.params[1]:.4f}")
-print(f"R-squared: {model.rsquared:.4f}")
+print(f"Intercept: {intercept:.4f}")
+print(f"Slope: {slope:.4f}")
+print(f"R-squared: {r_squared:.4f}")
 
 # Create a scatter plot
 plt.figure(figsize=(10, 6))
 plt.scatter(x, y, alpha=0.7, label='Data points')
 
 # Add regression line
-x_line = np.linspace(min(x), max(x), 100)
-y_line = model.params[0] + model.params[1] * x_line
-plt.plot(x_line, y_line, 'r-', label=f'Regression line (y = {model.params[0]:.2f} + {model.params[1]:.2f}x)')
+x_line = np.linspace(x.min(), x.max(), 100)
+y_line = intercept + slope * x_line
+plt.plot(x_line, y_line, 'r-', label=f'Regression line (y = {intercept:.2f} + {slope:.2f}x)')
 
 # Add labels and title
 plt.xlabel('X variable')
 plt.ylabel('Y variable')
-plt.title(f'Scatter Plot with Regression Line (r = {correlation:.2f}, R² = {model.rsquared:.2f})')
+plt.title(f'Scatter Plot with Regression Line (r = {correlation:.2f}, R² = {r_squared:.2f})')
 plt.grid(True, alpha=0.3)
 plt.legend()
 
 # Add annotation with regression statistics
 stats_text = f"Regression Statistics:\n" \
              f"Correlation (r): {correlation:.4f}\n" \
-             f"R-squared: {model.rsquared:.4f}\n" \
-             f"Intercept: {model.params[0]:.4f}\n" \
-             f"Slope: {model.params[1]:.4f}\n" \
-             f"p-value: {model.pvalues[1]:.4e}"
+             f"R-squared: {r_squared:.4f}\n" \
+             f"Intercept: {intercept:.4f}\n" \
+             f"Slope: {slope:.4f}\n" \
+             f"p-value: {slope_p_value:.4e}"
 plt.annotate(stats_text, xy=(0.05, 0.95), xycoords='axes fraction', 
              bbox=dict(boxstyle="round,pad=0.5", fc="white", alpha=0.8),
              va='top', fontsize=9)
@@ -4,78 +4,98 @@ Simple Correlation and Regression Analysis Example
 This script demonstrates:
 1. Generating random data with a known correlation
 2. Calculating correlation using NumPy
-3. Performing linear regression using statsmodels
+3. Performing linear regression with a QR-based least-squares solver
 """
 
 import numpy as np
-import statsmodels.api as sm
+import scipy.linalg
+from scipy import stats
+
+from _data import make_xy, pearson
 
-# Set a random seed for reproducibility
-np.random.seed(42)
 
-# Generate sample data with a known correlation
+# Generate sample data with a known correlation (seeded for reproducibility):
+# x from a standard normal distribution and y with a moderate positive
+# correlation with x (correlation ≈ 0.7)
 n = 100  # number of observations
-x = np.random.normal(0, 1, n)  # independent variable from standard normal distribution
-# Create y with a moderate positive correlation with x (correlation ≈ 0.7)
-y = 0.7 * x + np.random.normal(0, 0.7, n)  # dependent variable
+x, y = make_xy(n)
 
 # Calculate correlation using NumPy
-correlation = np.corrcoef(x, y)[0, 1]
+correlation = pearson(x, y)
 print(f"Correlation coefficient: {correlation:.4f}")
 
-# Perform simple linear regression using statsmodels
-# Add a constant (intercept) to the independent variable
-X = sm.add_constant(x)
+# Perform simple linear regression
+# Add a constant (intercept) column to the independent variable
+X = np.column_stack([np.ones_like(x), x])
+
+# Solve the least-squares problem through the QR decomposition X = QR:
+# R @ beta = Q.T @ y is solved by back-substitution
+Q, R = np.linalg.qr(X)
+beta = scipy.linalg.solve_triangular(R, Q.T @ y)
+residuals = y - X @ beta
+df_resid = n - 2
 
-# Create a linear regression model and fit it to the data
-model = sm.OLS(y, X).fit()
+# Coefficient covariance sigma^2 * (X'X)^-1, where (X'X)^-1 = R^-1 @ R^-T
+sigma2 = residuals @ residuals / df_resid
+cov = sigma2 * scipy.linalg.solve_triangular(R, scipy.linalg.solve_triangular(R.T, np.eye(2), lower=True))
+bse = np.sqrt(np.diag(cov))
+tvals = beta / bse
+pvals = 2 * stats.t.sf(np.abs(tvals), df_resid)
+
+# Goodness of fit
+r_squared = 1 - (residuals @ residuals) / np.sum((y - y.mean()) ** 2)
+r_squared_adj = 1 - (1 - r_squared) * (n - 1) / df_resid
+f_value = r_squared / ((1 - r_squared) / df_resid)
+f_pvalue = stats.f.sf(f_value, 1, df_resid)
 
 # Print regression summary
 print("\nRegression Summary:")
-print(f"Intercept: {model.params[0]:.4f}")
-print(f"Slope: {model.params[1]:.4f}")
-print(f"R-squared: {model.rsquared:.4f}")
-print(f"Adjusted R-squared: {model.rsquared_adj:.4f}")
-print(f"F-statistic: {model.fvalue:.4f}")
-print(f"Prob (F-statistic): {model.f_pvalue:.4e}")
+print(f"Intercept: {beta[0]:.4f}")
+print(f"Slope: {beta[1]:.4f}")
+print(f"R-squared: {r_squared:.4f}")
+print(f"Adjusted R-squared: {r_squared_adj:.4f}")
+print(f"F-statistic: {f_value:.4f}")
+print(f"Prob (F-statistic): {f_pvalue:.4e}")
 
 # Print coefficient statistics
 print("\nCoefficient Statistics:")
 print(f"{'Parameter':<10} {'Coefficient':<12} {'Std Error':<12} {'t-value':<10} {'p-value':<10}")
 print("-" * 60)
-for i, name in enumerate(['const', 'x']):
-    print(f"{name:<10} {model.params[i]:<12.4f} {model.bse[i]:<12.4f} {model.tvalues[i]:<10.4f} {model.pvalues[i]:<10.4e}")
+print("\n".join(
+    f"{name:<10} {coef:<12.4f} {se:<12.4f} {t:<10.4f} {p:<10.4e}"
+    for name, coef, se, t, p in zip(['const', 'x'], beta, bse, tvals, pvals)
+))
 
 # Interpretation of results
 print("\nInterpretation:")
 print(f"1. The correlation coefficient of {correlation:.4f} indicates a strong positive relationship between X and Y.")
-print(f"2. The regression model explains {model.rsquared:.1%} of the variance in Y (R-squared).")
-print(f"3. For each unit increase in X, Y increases by {model.params[1]:.4f} units on average.")
-print(f"4. The p-value of {model.pvalues[1]:.4e} indicates that this relationship is statistically significant.")
+print(f"2. The regression model explains {r_squared:.1%} of the variance in Y (R-squared).")
+print(f"3. For each unit increase in X, Y increases by {beta[1]:.4f} units on average.")
+print(f"4. The p-value of {pvals[1]:.4e} indicates that this relationship is statistically significant.")
 
 # Additional analysis: Residuals
-residuals = model.resid
 print("\nResidual Analysis:")
 print(f"Mean of residuals: {np.mean(residuals):.4e}")  # Should be close to zero
 print(f"Standard deviation of residuals: {np.std(residuals):.4f}")
 
 # Example of how to test for normality of residuals
-from scipy import stats
-_, normality_p_value = stats.normaltest(residuals)
-print(f"Normality test p-value: {normality_p_value:.4f}")
+_, normality_p_value = stats.jarque_bera(residuals)
+print(f"Normality test (Jarque-Bera) p-value: {normality_p_value:.4f}")
 print("Interpretation: If p-value > 0.05, residuals are approximately normally distributed.")
 
 # Example of prediction
 new_x = np.array([0.5, 1.0, 1.5])  # New data points for prediction
-new_X = sm.add_constant(new_x)  # Add constant term
-predictions = model.predict(new_X)
+new_X = np.column_stack([np.ones_like(new_x), new_x])  # Add constant term
+
+# Predictions and their 95% confidence intervals from the same design matrix;
+# the standard error of the mean prediction is sqrt(x0' @ cov @ x0) per row x0
+predictions = new_X @ beta
+pred_se = np.sqrt(np.sum((new_X @ cov) * new_X, axis=1))
+t_crit = stats.t.ppf(0.975, df_resid)
+pred_table = np.stack([new_x, predictions, predictions - t_crit * pred_se, predictions + t_crit * pred_se], axis=1)
 
 print("\nPredictions for new X values:")
-for i, x_val in enumerate(new_x):
-    print(f"X = {x_val:.1f}, Predicted Y = {predictions[i]:.4f}")
+print("\n".join(f"X = {x_val:.1f}, Predicted Y = {pred:.4f}" for x_val, pred, _, _ in pred_table))
 
-# Confidence intervals for the predictions
-pred_conf = model.get_prediction(new_X).conf_int(alpha=0.05)
 print("\nPrediction 95% Confidence Intervals:")
-for i, x_val in enumerate(new_x):
-    print(f"X = {x_val:.1f}, CI: [{pred_conf[i,0]:.4f}, {pred_conf[i,1]:.4f}]") 
\ No newline at end of file
+print("\n".join(f"X = {x_val:.1f}, CI: [{lower:.4f}, {upper:.4f}]" for x_val, _, lower, upper in pred_table)) 
\ No newline at end of file